@@ -81,6 +81,26 @@ namespace QuantConnect.DataSource
         /// </summary>
         public decimal? SentimentalBuzzVolume30Days { get; set; }
 
+        /// <summary>
+        /// Percentile rank of <see cref="Sentiment7Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Sentiment7DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Sentiment7Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Sentiment7DaysZScore { get; set; }
+
+        /// <summary>
+        /// Percentile rank of <see cref="Sentiment30Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Sentiment30DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Sentiment30Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Sentiment30DaysZScore { get; set; }
+
         /// <summary>
         /// Time the data became available
         /// </summary>
@@ -136,6 +156,11 @@ namespace QuantConnect.DataSource
                 TotalBuzzVolume30Days = csv[10].IfNotNullOrEmpty<decimal?>(s => decimal.Parse(s, NumberStyles.Any, CultureInfo.InvariantCulture)),
                 SentimentalBuzzVolume30Days = csv[11].IfNotNullOrEmpty<decimal?>(s => decimal.Parse(s, NumberStyles.Any, CultureInfo.InvariantCulture)),
 
+                Sentiment7DaysPercentile = csv.GetOptionalDecimal(12),
+                Sentiment7DaysZScore = csv.GetOptionalDecimal(13),
+                Sentiment30DaysPercentile = csv.GetOptionalDecimal(14),
+                Sentiment30DaysZScore = csv.GetOptionalDecimal(15),
+
                 Symbol = new Symbol(SecurityIdentifier.Parse(csv[0]), csv[1]),
                 // We need to convert the time since the date is in UTC, and AddUniverse sets the ExchangeTimeZone to TimeZones.NewYork
                 // Subtract 12 hours to match the BrainSentimentIndicatorBase EndTime
@@ -183,7 +208,12 @@ namespace QuantConnect.DataSource
                 SentimentalArticleMentions30Days = SentimentalArticleMentions30Days,
                 Sentiment30Days = Sentiment30Days,
                 TotalBuzzVolume30Days = TotalBuzzVolume30Days,
-                SentimentalBuzzVolume30Days = SentimentalBuzzVolume30Days
+                SentimentalBuzzVolume30Days = SentimentalBuzzVolume30Days,
+
+                Sentiment7DaysPercentile = Sentiment7DaysPercentile,
+                Sentiment7DaysZScore = Sentiment7DaysZScore,
+                Sentiment30DaysPercentile = Sentiment30DaysPercentile,
+                Sentiment30DaysZScore = Sentiment30DaysZScore
             };
         }
 
@@ -12,6 +12,8 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from io import StringIO
+from time import perf_counter
 
 class BrainSentimentIndicatorUniverseAlgorithm(QCAlgorithm):
     def Initialize(self):
@@ -33,24 +35,41 @@ class BrainSentimentIndicatorUniverseAlgorithm(QCAlgorithm):
             if len(dataForDate) < 1000:
                 raise ValueError(f"Unexpected historical universe data!")
 
+        # Opt-in timing comparison of the vectorized and per-object selection over 3 years of universe history
+        if self.GetParameter("compare-selection", "false").lower() == "true":
+            self.CompareSelectionTimings(universe)
+
     def UniverseSelection(self, data):
-        for datum in data:
-            self.Log(f"""{datum.Symbol},
-                    {datum.TotalArticleMentions7Days},
-                    {datum.SentimentalArticleMentions7Days},
-                    {datum.Sentiment7Days},
-                    {datum.TotalBuzzVolume7Days},
-                    {datum.SentimentalBuzzVolume7Days},
-                    {datum.TotalArticleMentions30Days},
-                    {datum.SentimentalArticleMentions30Days},
-                    {datum.Sentiment30Days},
-                    {datum.TotalBuzzVolume30Days},
-                    {datum.SentimentalBuzzVolume30Days}""")
+        # Load the whole day into a DataFrame with a single call into C#, and select with a vectorized mask
+        # instead of reading the properties of every datum one by one
+        # Only empty fields are missing values, so tickers such as NA or NULL are kept as they are
+        df = pd.read_csv(StringIO(BrainUniverseColumns.GetSentimentIndicatorCsv(data)), keep_default_na=False, na_values=[""])
+        mask = (df["TotalArticleMentions7Days"] > 0) & df["Sentiment7Days"].notna() & (df["Sentiment7Days"] != 0)
 
         # define our selection criteria
+        symbols = BrainUniverseColumns.GetSymbols(data)
+        return [symbols[i] for i in np.flatnonzero(mask.to_numpy()).tolist()]
+
+    def UniverseSelectionByObject(self, data):
         return [d.Symbol for d in data \
                     if d.TotalArticleMentions7Days and d.TotalArticleMentions7Days > 0 \
                     and d.Sentiment7Days]
 
+    def CompareSelectionTimings(self, universe):
+        history = list(self.History(universe, TimeSpan(3 * 365, 0, 0, 0)))
+        timings = {}
+
+        for selection in [self.UniverseSelectionByObject, self.UniverseSelection]:
+            start = perf_counter()
+            selected = [selection(dataForDate) for dataForDate in history]
+            timings[selection.__name__] = (perf_counter() - start, selected)
+
+        by_object, by_object_selected = timings["UniverseSelectionByObject"]
+        vectorized, vectorized_selected = timings["UniverseSelection"]
+        if [set(s) for s in by_object_selected] != [set(s) for s in vectorized_selected]:
+            raise ValueError("Vectorized universe selection does not match the per-object selection!")
+
+        self.Log(f"Universe selection over {len(history)} days: per-object {by_object:.2f}s, vectorized {vectorized:.2f}s")
+
     def OnSecuritiesChanged(self, changes):
         self.Log(changes.ToString())
\ No newline at end of file
@@ -56,6 +56,56 @@ namespace QuantConnect.DataSource
         /// </summary>
         public decimal? Rank21Days { get; set; }
 
+        /// <summary>
+        /// Percentile rank of <see cref="Rank2Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank2DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Rank2Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank2DaysZScore { get; set; }
+
+        /// <summary>
+        /// Percentile rank of <see cref="Rank3Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank3DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Rank3Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank3DaysZScore { get; set; }
+
+        /// <summary>
+        /// Percentile rank of <see cref="Rank5Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank5DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Rank5Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank5DaysZScore { get; set; }
+
+        /// <summary>
+        /// Percentile rank of <see cref="Rank10Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank10DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Rank10Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank10DaysZScore { get; set; }
+
+        /// <summary>
+        /// Percentile rank of <see cref="Rank21Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank21DaysPercentile { get; set; }
+
+        /// <summary>
+        /// Z-score of <see cref="Rank21Days"/> among all securities of the same date
+        /// </summary>
+        public decimal? Rank21DaysZScore { get; set; }
+
         /// <summary>
         /// Time the data became available
         /// </summary>
@@ -105,6 +155,17 @@ namespace QuantConnect.DataSource
                 Rank10Days = csv[5].IfNotNullOrEmpty<decimal?>(s => decimal.Parse(s, NumberStyles.Any, CultureInfo.InvariantCulture)),
                 Rank21Days = csv[6].IfNotNullOrEmpty<decimal?>(s => decimal.Parse(s, NumberStyles.Any, CultureInfo.InvariantCulture)),
 
+                Rank2DaysPercentile = csv.GetOptionalDecimal(7),
+                Rank2DaysZScore = csv.GetOptionalDecimal(8),
+                Rank3DaysPercentile = csv.GetOptionalDecimal(9),
+                Rank3DaysZScore = csv.GetOptionalDecimal(10),
+                Rank5DaysPercentile = csv.GetOptionalDecimal(11),
+                Rank5DaysZScore = csv.GetOptionalDecimal(12),
+                Rank10DaysPercentile = csv.GetOptionalDecimal(13),
+                Rank10DaysZScore = csv.GetOptionalDecimal(14),
+                Rank21DaysPercentile = csv.GetOptionalDecimal(15),
+                Rank21DaysZScore = csv.GetOptionalDecimal(16),
+
                 Symbol = new Symbol(SecurityIdentifier.Parse(csv[0]), csv[1]),
                 // We need to convert the time since the date is in UTC, and AddUniverse sets the ExchangeTimeZone to TimeZones.NewYork
                 // Subtract 12 hours to match the BrainStockRankingBase EndTime
@@ -137,7 +198,18 @@ namespace QuantConnect.DataSource
                 Rank3Days = Rank3Days,
                 Rank5Days = Rank5Days,
                 Rank10Days = Rank10Days,
-                Rank21Days = Rank21Days
+                Rank21Days = Rank21Days,
+
+                Rank2DaysPercentile = Rank2DaysPercentile,
+                Rank2DaysZScore = Rank2DaysZScore,
+                Rank3DaysPercentile = Rank3DaysPercentile,
+                Rank3DaysZScore = Rank3DaysZScore,
+                Rank5DaysPercentile = Rank5DaysPercentile,
+                Rank5DaysZScore = Rank5DaysZScore,
+                Rank10DaysPercentile = Rank10DaysPercentile,
+                Rank10DaysZScore = Rank10DaysZScore,
+                Rank21DaysPercentile = Rank21DaysPercentile,
+                Rank21DaysZScore = Rank21DaysZScore
             };
         }
 
@@ -0,0 +1,214 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using System.Text;
+using QuantConnect.Data;
+
+namespace QuantConnect.DataSource
+{
+    /// <summary>
+    /// Flattens a day of Brain universe data into CSV text with a header row, so Python algorithms can load it
+    /// with a single call to pandas.read_csv instead of reading the properties of every datum one by one
+    /// </summary>
+    /// <remarks>Rows are in the same order as the data, which is also the order of <see cref="GetSymbols"/></remarks>
+    public static class BrainUniverseColumns
+    {
+        private static readonly string[] _sentimentIndicatorColumns =
+        {
+            "TotalArticleMentions7Days",
+            "SentimentalArticleMentions7Days",
+            "Sentiment7Days",
+            "TotalBuzzVolume7Days",
+            "SentimentalBuzzVolume7Days",
+            "TotalArticleMentions30Days",
+            "SentimentalArticleMentions30Days",
+            "Sentiment30Days",
+            "TotalBuzzVolume30Days",
+            "SentimentalBuzzVolume30Days",
+            "Sentiment7DaysPercentile",
+            "Sentiment7DaysZScore",
+            "Sentiment30DaysPercentile",
+            "Sentiment30DaysZScore"
+        };
+
+        private static readonly string[] _languageMetricsSections =
+        {
+            "ReportSentiment",
+            "RiskFactorsStatementSentiment",
+            "ManagementDiscussionAnalyasisOfFinancialConditionAndResultsOfOperations"
+        };
+
+        private static readonly string[] _languageMetricsColumns =
+        {
+            "SentenceCount",
+            "MeanSentenceLength",
+            "Sentiment",
+            "Uncertainty",
+            "Litigious",
+            "Constraining",
+            "Interesting",
+            "Readability",
+            "LexicalRichness",
+            "LexicalDensity",
+            "SpecificDensity",
+            "Similarity_All",
+            "Similarity_Positive",
+            "Similarity_Negative",
+            "Similarity_Uncertainty",
+            "Similarity_Litigious",
+            "Similarity_Constraining",
+            "Similarity_Interesting"
+        };
+
+        /// <summary>
+        /// Gets the symbols of the data, in the same order as the rows of the CSV text
+        /// </summary>
+        /// <param name="data">Universe data of a single date</param>
+        /// <returns>The symbol of every datum</returns>
+        public static Symbol[] GetSymbols(IEnumerable<BaseData> data)
+        {
+            return data.Select(datum => datum.Symbol).ToArray();
+        }
+
+        /// <summary>
+        /// Flattens <see cref="BrainSentimentIndicatorUniverse"/> data into CSV text
+        /// </summary>
+        /// <param name="data">Universe data of a single date</param>
+        /// <returns>CSV text with a header row and one row by datum. Missing values are empty</returns>
+        public static string GetSentimentIndicatorCsv(IEnumerable<BaseData> data)
+        {
+            var csv = new StringBuilder();
+            AppendHeader(csv, _sentimentIndicatorColumns);
+
+            foreach (BrainSentimentIndicatorUniverse datum in data)
+            {
+                csv.Append(datum.Symbol.Value);
+                Append(csv, datum.TotalArticleMentions7Days);
+                Append(csv, datum.SentimentalArticleMentions7Days);
+                Append(csv, datum.Sentiment7Days);
+                Append(csv, datum.TotalBuzzVolume7Days);
+                Append(csv, datum.SentimentalBuzzVolume7Days);
+                Append(csv, datum.TotalArticleMentions30Days);
+                Append(csv, datum.SentimentalArticleMentions30Days);
+                Append(csv, datum.Sentiment30Days);
+                Append(csv, datum.TotalBuzzVolume30Days);
+                Append(csv, datum.SentimentalBuzzVolume30Days);
+                Append(csv, datum.Sentiment7DaysPercentile);
+                Append(csv, datum.Sentiment7DaysZScore);
+                Append(csv, datum.Sentiment30DaysPercentile);
+                Append(csv, datum.Sentiment30DaysZScore);
+                csv.Append('\n');
+            }
+
+            return csv.ToString();
+        }
+
+        /// <summary>
+        /// Flattens <see cref="BrainCompanyFilingLanguageMetricsUniverseAll"/> or <see cref="BrainCompanyFilingLanguageMetricsUniverse10K"/>
+        /// data into CSV text. Columns are named after the report section and the metric, e.g. ReportSentiment_Sentiment
+        /// </summary>
+        /// <param name="data">Universe data of a single date</param>
+        /// <returns>CSV text with a header row and one row by datum. Missing values are empty</returns>
+        public static string GetCompanyFilingLanguageMetricsCsv(IEnumerable<BaseData> data)
+        {
+            var csv = new StringBuilder();
+            AppendHeader(csv, _languageMetricsSections.SelectMany(section => _languageMetricsColumns.Select(column => $"{section}_{column}")));
+
+            foreach (var datum in data)
+            {
+                csv.Append(datum.Symbol.Value);
+                foreach (var metrics in GetLanguageMetricsSections(datum))
+                {
+                    Append(csv, metrics?.SentenceCount);
+                    Append(csv, metrics?.MeanSentenceLength);
+                    Append(csv, metrics?.Sentiment);
+                    Append(csv, metrics?.Uncertainty);
+                    Append(csv, metrics?.Litigious);
+                    Append(csv, metrics?.Constraining);
+                    Append(csv, metrics?.Interesting);
+                    Append(csv, metrics?.Readability);
+                    Append(csv, metrics?.LexicalRichness);
+                    Append(csv, metrics?.LexicalDensity);
+                    Append(csv, metrics?.SpecificDensity);
+
+                    var similarity = metrics?.Similarity;
+                    Append(csv, similarity?.All);
+                    Append(csv, similarity?.Positive);
+                    Append(csv, similarity?.Negative);
+                    Append(csv, similarity?.Uncertainty);
+                    Append(csv, similarity?.Litigious);
+                    Append(csv, similarity?.Constraining);
+                    Append(csv, similarity?.Interesting);
+                }
+                csv.Append('\n');
+            }
+
+            return csv.ToString();
+        }
+
+        private static BrainCompanyFilingLanguageMetrics[] GetLanguageMetricsSections(BaseData datum)
+        {
+            return datum switch
+            {
+                BrainCompanyFilingLanguageMetricsUniverseAll all => new[]
+                {
+                    all.ReportSentiment,
+                    all.RiskFactorsStatementSentiment,
+                    all.ManagementDiscussionAnalyasisOfFinancialConditionAndResultsOfOperations
+                },
+                BrainCompanyFilingLanguageMetricsUniverse10K tenK => new[]
+                {
+                    tenK.ReportSentiment,
+                    tenK.RiskFactorsStatementSentiment,
+                    tenK.ManagementDiscussionAnalyasisOfFinancialConditionAndResultsOfOperations
+                },
+                _ => throw new ArgumentException($"Unexpected universe data type: {datum.GetType().Name}")
+            };
+        }
+
+        private static void AppendHeader(StringBuilder csv, IEnumerable<string> columns)
+        {
+            csv.Append("Ticker");
+            foreach (var column in columns)
+            {
+                csv.Append(',').Append(column);
+            }
+            csv.Append('\n');
+        }
+
+        private static void Append(StringBuilder csv, decimal? value)
+        {
+            csv.Append(',');
+            if (value.HasValue)
+            {
+                csv.Append(value.Value.ToString(CultureInfo.InvariantCulture));
+            }
+        }
+
+        private static void Append(StringBuilder csv, int? value)
+        {
+            csv.Append(',');
+            if (value.HasValue)
+            {
+                csv.Append(value.Value.ToString(CultureInfo.InvariantCulture));
+            }
+        }
+    }
+}
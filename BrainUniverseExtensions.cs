@@ -0,0 +1,42 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System.Globalization;
+
+namespace QuantConnect.DataSource
+{
+    /// <summary>
+    /// Helpers to read the optional columns of Brain universe rows, which universe files written before the columns were added don't have
+    /// </summary>
+    internal static class BrainUniverseExtensions
+    {
+        /// <summary>
+        /// Gets the value at the index, or the default value if the row is shorter
+        /// </summary>
+        public static T GetOptional<T>(this T[] values, int index)
+        {
+            return index < values.Length ? values[index] : default;
+        }
+
+        /// <summary>
+        /// Parses the CSV column at the index, or null if the row is shorter or the column is empty
+        /// </summary>
+        public static decimal? GetOptionalDecimal(this string[] csv, int index)
+        {
+            return csv.GetOptional(index).IfNotNullOrEmpty<decimal?>(s => decimal.Parse(s, NumberStyles.Any, CultureInfo.InvariantCulture));
+        }
+    }
+}
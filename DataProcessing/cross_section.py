@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+
+
+def cross_sectional_statistics(df):
+    """ Percentile rank and z-score of every column against all tickers of the same date, formatted as CSV by ticker """
+    df = df.apply(pd.to_numeric, errors="coerce")
+    percentiles = df.rank(pct=True)
+    # A date where every ticker has the same value has no meaningful z-score
+    z_scores = (df - df.mean()) / df.std(ddof=0).replace(0, np.nan)
+
+    columns = []
+    for column in df.columns:
+        for statistic in (percentiles[column], z_scores[column]):
+            columns.append(statistic.map("{:f}".format).where(statistic.notna(), ""))
+
+    return pd.concat(columns, axis=1).agg(",".join, axis=1)
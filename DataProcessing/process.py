@@ -8,6 +8,7 @@ from botocore.exceptions import ClientError
 # CLRImports is required to handle Lean C# objects
 from CLRImports import *
 
+from shard import ShardSpec, SHARD_PIECE_EXTENSION, get_merge_order, get_shard_directories, merge_pieces, remove_shard_directories
 from universe import UniverseDataProcessing
 
 S3_USER_KEY_ID = os.environ['AWS_ACCESS_KEY_ID']
@@ -17,13 +18,20 @@ S3_BUCKET_NAME = os.environ['BRAIN_S3_BUCKET_NAME']
 DATE_FORMAT = '%Y-%m-%d'
 OUTPUT_DATE_FORMAT = '%Y%m%d'
 
-OUTPUT_DATA_PATH = Path('/temp-output-directory') / 'alternative' / 'brain'
+OUTPUT_DATA_PATH = Path(os.environ.get('OUTPUT_DIRECTORY', '/temp-output-directory')) / 'alternative' / 'brain'
 PROCESS_ALL = False if 'PROCESS_ALL' not in os.environ else os.environ['PROCESS_ALL'].lower() == 'true'
 PROCESS_DATE = datetime(2010, 1, 1) if PROCESS_ALL else datetime.strptime(os.environ['QC_DATAFLEET_DEPLOYMENT_DATE'], '%Y%m%d')
 PROCESS_DATE_STR = PROCESS_DATE.strftime(DATE_FORMAT)
 
 LOCAL_FOLDER = Path('./output')
 
+# Sharded runs parse a disjoint slice of the raw files into their own root, and a final merge run
+# (MERGE_SHARDS=true, SHARD_COUNT=N) writes the same output an unsharded run would. The shard root
+# is kept next to the raw files, outside the output directory that gets published
+SHARD_OUTPUT_PATH = Path(os.environ.get('SHARD_OUTPUT_DIRECTORY', LOCAL_FOLDER.parent / 'shards'))
+MERGE_SHARDS = False if 'MERGE_SHARDS' not in os.environ else os.environ['MERGE_SHARDS'].lower() == 'true'
+SHARD = None if MERGE_SHARDS else ShardSpec.from_environment()
+
 REPORT_KEY_PREFIX = 'BLMCF_V2'
 SENTIMENT_KEY_PREFIX = 'BSI'
 RANKINGS_KEY_PREFIX = 'BSR'
@@ -170,10 +178,12 @@ class BrainProcessor:
         map_file = self.map_file_resolver.ResolveMapFile(ticker, datetime.now())
         return map_file.GetMappedSymbol(trading_date, None)
 
-    def parse_raw(self, file, category, date, lookback_days=None):
+    def parse_raw(self, file, category, date, lookback_days=None, shard=None):
         columns = list(self.category_parsing_columns[category]) + ['COMPOSITE_FIGI']
         if lookback_days is not None:
             columns.append('lookback_days')
+        if shard is not None:
+            columns.append('raw_row')
 
         if not file.exists():
             return self.create_empty_df(columns)
@@ -182,6 +192,11 @@ class BrainProcessor:
         ticker_column = None
 
         df = pd.read_csv(file)
+        if shard is not None:
+            df = df[shard.owns_securities(df['COMPOSITE_FIGI'])].copy()
+            # Keeps the position in the raw file so the merge can restore the unsharded row order
+            df['raw_row'] = df.index
+
         if 'TICKER' in df:
             ticker_column = 'TICKER'
             sec_def_columns.insert(0, 'TICKER')
@@ -190,7 +205,11 @@ class BrainProcessor:
             sec_def_columns.insert(0, 'PRIMARY_EXCHANGE_TICKER')
 
         df['date'] = date
-        df['ticker'] = df[sec_def_columns].apply(lambda sec_def: self.figi_to_mapped_ticker(sec_def[ticker_column] if ticker_column is not None else None, sec_def['COMPOSITE_FIGI'], date), axis=1)
+        if df.empty:
+            # apply() returns an empty DataFrame instead of a Series when there are no rows
+            df['ticker'] = pd.Series(dtype=object)
+        else:
+            df['ticker'] = df[sec_def_columns].apply(lambda sec_def: self.figi_to_mapped_ticker(sec_def[ticker_column] if ticker_column is not None else None, sec_def['COMPOSITE_FIGI'], date), axis=1)
         df = df[~df['ticker'].isnull()]
         df = df.set_index('date', append=False).set_index('ticker', append=True)
 
@@ -202,7 +221,6 @@ class BrainProcessor:
     def process(self):
         category_files = {k: self.filter_files_by_category(k) for k in CATEGORY_KEY_PREFIXES.keys()}
         category_df_collection = {k: [] for k in CATEGORY_KEY_PREFIXES.keys()}
-        category_dfs = {k: None for k in CATEGORY_KEY_PREFIXES.keys()}
 
         for category, files in category_files.items():
             for file_path, lookback_days, date in files:
@@ -210,6 +228,45 @@ class BrainProcessor:
                 df = self.parse_raw(file_path, category, date, lookback_days)
                 category_df_collection[category].append(df)
 
+        self.process_parsed(category_df_collection)
+
+    def process_shard(self, shard):
+        shard_path = shard.clear(SHARD_OUTPUT_PATH)
+
+        for file_path, lookback_days, category, date in self.files:
+            print(f'Parsing {file_path} for shard {shard.index} of {shard.count}')
+            df = self.parse_raw(file_path, category, date, lookback_days, shard).reset_index()
+
+            # Symbols can't be pickled, so we store their SecurityIdentifier and rebuild them when merging
+            df['ticker_sid'] = pd.Series([str(t.ID) if isinstance(t, Symbol) else None for t in df['ticker']], index=df.index, dtype=object)
+            df['ticker'] = pd.Series([t.Value if isinstance(t, Symbol) else t for t in df['ticker']], index=df.index, dtype=object)
+            df.to_pickle(shard_path / f'{Path(file_path).stem}{SHARD_PIECE_EXTENSION}')
+
+        shard.mark_complete(SHARD_OUTPUT_PATH, PROCESS_DATE)
+        print(f'Finished processing shard {shard.index} of {shard.count}')
+
+    def merge_shards(self, shard_count):
+        shard_paths = get_shard_directories(SHARD_OUTPUT_PATH, shard_count, PROCESS_DATE)
+        file_pieces = {}
+        for shard_path in shard_paths:
+            for piece in sorted(shard_path.glob(f'*{SHARD_PIECE_EXTENSION}')):
+                file_pieces.setdefault(piece.stem, []).append(piece)
+
+        category_df_collection = {k: [] for k in CATEGORY_KEY_PREFIXES.keys()}
+        for category, stem in get_merge_order(file_pieces.keys(), FILE_PREFIXES):
+            print(f'Merging {len(file_pieces[stem])} shard(s) of {stem}')
+            df = merge_pieces([pd.read_pickle(piece) for piece in file_pieces[stem]])
+
+            df['ticker'] = [Symbol(SecurityIdentifier.Parse(sid), t) if isinstance(sid, str) else t for t, sid in zip(df['ticker'], df['ticker_sid'])]
+            df = df.drop(columns=['ticker_sid']).set_index(['date', 'ticker'])
+            category_df_collection[category].append(df)
+
+        self.process_parsed(category_df_collection)
+        remove_shard_directories(shard_paths)
+
+    def process_parsed(self, category_df_collection):
+        category_dfs = {k: None for k in CATEGORY_KEY_PREFIXES.keys()}
+
         for category, dfs in category_df_collection.items():
             if len(dfs) == 0:
                 print(f'No DataFrame created for category: {category}')
@@ -319,7 +376,7 @@ def download_file_s3(s3, file_prefix, category, date):
     print(f'Finished downloading: {file_name}')
     return file_path
 
-def download():
+def download(shard=None):
     LOCAL_FOLDER.mkdir(parents=True, exist_ok=True)
 
     # -- Get file names until current date
@@ -346,6 +403,9 @@ def download():
 
     # -- Download files
     for file_key, lookback_days, category, date in file_names:
+        if shard is not None and not shard.owns_date(date):
+            continue
+
         if date == date_start and category in REPORT_CATEGORIES:
             previous_file_date = date_start
             oldest_file_date = previous_file_date - timedelta(days=14)
@@ -370,7 +430,16 @@ def download():
 
 
 def main(universe_only = False):
-    if not universe_only:
+    if SHARD is not None:
+        processor = BrainProcessor(download(SHARD))
+        processor.process_shard(SHARD)
+        # Universe files are created from the merged output
+        return
+
+    if MERGE_SHARDS:
+        processor = BrainProcessor([])
+        processor.merge_shards(int(os.environ['SHARD_COUNT']))
+    elif not universe_only:
         files = download()
         processor = BrainProcessor(files)
         processor.process()
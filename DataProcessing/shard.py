@@ -0,0 +1,202 @@
+import filecmp
+import json
+import os
+import shutil
+import subprocess
+import sys
+import zlib
+
+import pandas as pd
+
+from pathlib import Path
+
+SHARD_BY_MONTH = 'month'
+SHARD_BY_TICKER = 'ticker'
+
+SHARD_COMPLETE_FILE_NAME = 'shard.json'
+SHARD_PIECE_EXTENSION = '.pkl'
+
+
+class ShardSpec:
+    def __init__(self, index, count, by=SHARD_BY_MONTH):
+        if by not in (SHARD_BY_MONTH, SHARD_BY_TICKER):
+            raise ValueError(f'Unsupported shard mode: {by}. Expected "{SHARD_BY_MONTH}" or "{SHARD_BY_TICKER}"')
+        if count < 1 or index < 0 or index >= count:
+            raise ValueError(f'Invalid shard {index} of {count}')
+
+        self.index = index
+        self.count = count
+        self.by = by
+
+    @staticmethod
+    def from_environment():
+        if 'SHARD_COUNT' not in os.environ:
+            return None
+
+        return ShardSpec(
+            int(os.environ['SHARD_INDEX']),
+            int(os.environ['SHARD_COUNT']),
+            os.environ.get('SHARD_BY', SHARD_BY_MONTH).lower())
+
+    def owns_date(self, date):
+        if self.by != SHARD_BY_MONTH:
+            return True
+
+        # Months are dealt round-robin so every shard gets a similar mix of old (sparse) and recent (dense) data
+        return (date.year * 12 + date.month - 1) % self.count == self.index
+
+    def owns_securities(self, composite_figis):
+        if self.by != SHARD_BY_TICKER:
+            return pd.Series(True, index=composite_figis.index)
+
+        # The raw ticker can be missing and the mapped ticker is only known after the expensive
+        # symbol resolution, so the hash is taken over the composite FIGI every raw file carries.
+        # crc32 is used instead of hash() since the latter is salted per process.
+        return composite_figis.map(lambda figi: zlib.crc32(str(figi).encode('utf-8')) % self.count == self.index)
+
+    def directory(self, root):
+        return Path(root) / f'shard_{self.index}'
+
+    def clear(self, root):
+        # Pieces or a marker left by an earlier run must never reach the merge
+        directory = self.directory(root)
+        if directory.exists():
+            shutil.rmtree(directory)
+        directory.mkdir(parents=True)
+        return directory
+
+    def mark_complete(self, root, process_date):
+        # Pickles are only guaranteed to load with the pandas version that wrote them, so the merge checks it
+        with open(self.directory(root) / SHARD_COMPLETE_FILE_NAME, 'w', encoding='utf-8') as marker:
+            json.dump({
+                'index': self.index,
+                'count': self.count,
+                'by': self.by,
+                'process_date': process_date.strftime('%Y%m%d'),
+                'pandas_version': pd.__version__
+            }, marker)
+
+    def to_environment(self):
+        return {'SHARD_INDEX': str(self.index), 'SHARD_COUNT': str(self.count), 'SHARD_BY': self.by}
+
+
+def get_shard_directories(root, count, process_date):
+    """ Get the output directory of every shard, failing if any shard did not complete or was processed differently """
+    directories = []
+    shard_by = None
+    for index in range(count):
+        directory = ShardSpec(index, count).directory(root)
+        marker = directory / SHARD_COMPLETE_FILE_NAME
+        if not marker.exists():
+            raise ValueError(f'Shard {index} of {count} has not completed: {directory}')
+
+        with open(marker, 'r', encoding='utf-8') as file:
+            spec = json.load(file)
+        if spec['index'] != index or spec['count'] != count:
+            raise ValueError(f'Shard {index} was processed as shard {spec["index"]} of {spec["count"]}, expected {index} of {count}')
+        if spec['process_date'] != process_date.strftime('%Y%m%d'):
+            raise ValueError(f'Shard {index} was processed for {spec["process_date"]}, expected {process_date:%Y%m%d}')
+
+        if spec.get('pandas_version') != pd.__version__:
+            raise ValueError(f'Shard {index} was written with pandas {spec.get("pandas_version")}, but the merge runs pandas {pd.__version__}')
+
+        shard_by = shard_by or spec['by']
+        if spec['by'] != shard_by:
+            raise ValueError(f'Shard {index} was sharded by {spec["by"]}, but shard 0 by {shard_by}')
+
+        directories.append(directory)
+
+    return directories
+
+
+def remove_shard_directories(directories):
+    """ Deletes the shard outputs once they have been merged """
+    for directory in directories:
+        shutil.rmtree(directory)
+
+
+def get_merge_order(stems, file_prefixes):
+    """ Orders the raw file stems (<file prefix>_<yyyyMMdd>) as an unsharded run parses them, returning (category, stem) pairs
+
+    An unsharded run parses the files by date, then in the order of the file prefixes. The only exception is the report file
+    of the first date, which is looked up to 14 days back and so carries an earlier date. It is still the earliest file of
+    its category, which is the only order the merge depends on since every category is concatenated on its own.
+    """
+    prefix_order = {file_prefix: (i, category) for i, (file_prefix, _, category) in enumerate(file_prefixes)}
+    file_order = []
+    for stem in stems:
+        file_prefix, date = stem.rsplit('_', 1)
+        order, category = prefix_order[file_prefix]
+        file_order.append((date, order, category, stem))
+
+    return [(category, stem) for _, _, category, stem in sorted(file_order)]
+
+
+def merge_pieces(pieces):
+    """ Concatenates the pieces every shard parsed from the same raw file back into the row order of the raw file """
+    df = pd.concat(pieces)
+    return df.sort_values('raw_row', kind='stable').drop(columns=['raw_row'])
+
+
+def run_local(count, by=SHARD_BY_MONTH, env=None):
+    """ Process all shards as local processes and merge their outputs """
+    env = dict(os.environ if env is None else env)
+    process_path = str(Path(__file__).parent / 'process.py')
+    processes = []
+
+    for index in range(count):
+        shard_env = dict(env, **ShardSpec(index, count, by).to_environment())
+        shard_env.pop('MERGE_SHARDS', None)
+        processes.append(subprocess.Popen([sys.executable, process_path, '0'], env=shard_env))
+
+    failed = [index for index, process in enumerate(processes) if process.wait() != 0]
+    if len(failed) > 0:
+        raise RuntimeError(f'Shards {failed} of {count} failed')
+
+    merge_env = dict(env, SHARD_COUNT=str(count), MERGE_SHARDS='true')
+    merge_env.pop('SHARD_INDEX', None)
+    subprocess.check_call([sys.executable, process_path, '0'], env=merge_env)
+
+
+def verify_local(count, by=SHARD_BY_MONTH, root=Path('./shard-verification')):
+    """ Runs process.py unsharded and with N local shards over the same downloaded files, and fails unless both outputs are byte-identical """
+    root = Path(root).resolve()
+    if root.exists():
+        # Universe files are appended to, so both runs must start from empty output directories
+        shutil.rmtree(root)
+
+    env = {k: v for k, v in os.environ.items() if k not in ('SHARD_INDEX', 'SHARD_COUNT', 'SHARD_BY', 'MERGE_SHARDS')}
+    process_path = str(Path(__file__).parent / 'process.py')
+
+    # The unsharded run downloads the raw files into LOCAL_FOLDER, which the shard runs then reuse
+    subprocess.check_call([sys.executable, process_path, '0'], env=dict(env, OUTPUT_DIRECTORY=str(root / 'unsharded')))
+    run_local(count, by, dict(env, OUTPUT_DIRECTORY=str(root / 'sharded'), SHARD_OUTPUT_DIRECTORY=str(root / 'shards')))
+
+    expected = root / 'unsharded'
+    actual = root / 'sharded'
+    expected_files = sorted(str(path.relative_to(expected)) for path in expected.rglob('*') if path.is_file())
+    actual_files = sorted(str(path.relative_to(actual)) for path in actual.rglob('*') if path.is_file())
+
+    if expected_files != actual_files:
+        missing = sorted(set(expected_files) - set(actual_files))
+        extra = sorted(set(actual_files) - set(expected_files))
+        raise RuntimeError(f'Sharded output files differ. Missing: {missing[:10]} Extra: {extra[:10]}')
+
+    _, mismatch, errors = filecmp.cmpfiles(expected, actual, expected_files, shallow=False)
+    if len(mismatch) > 0 or len(errors) > 0:
+        raise RuntimeError(f'{len(mismatch) + len(errors)} sharded output files differ from the unsharded run: {(mismatch + errors)[:10]}')
+
+    print(f'{len(expected_files)} output files of {count} shards by {by} are identical to the unsharded run')
+
+
+if __name__ == '__main__':
+    arguments = [argument for argument in sys.argv[1:] if argument != '--verify']
+    if len(arguments) not in (1, 2):
+        raise ValueError("shard.py takes the shard count, optionally the shard mode (month or ticker) and --verify.")
+
+    count = int(arguments[0])
+    by = arguments[1].lower() if len(arguments) == 2 else SHARD_BY_MONTH
+    if '--verify' in sys.argv:
+        verify_local(count, by)
+    else:
+        run_local(count, by)
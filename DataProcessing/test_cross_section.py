@@ -0,0 +1,38 @@
+import unittest
+
+import pandas as pd
+
+from cross_section import cross_sectional_statistics
+
+
+class CrossSectionalStatisticsTests(unittest.TestCase):
+    def test_percentile_and_z_score(self):
+        # Values 1, 2, 3, 4 have mean 2.5 and population standard deviation sqrt(1.25)
+        df = pd.DataFrame({"2": ["1", "2", "3", "4"], "3": ["0.5", "", None, "0.5"]}, index=["a", "b", "c", "d"])
+
+        statistics = cross_sectional_statistics(df)
+
+        self.assertEqual("0.250000,-1.341641,0.750000,", statistics["a"])
+        self.assertEqual("0.500000,-0.447214,,", statistics["b"])
+        self.assertEqual("0.750000,0.447214,,", statistics["c"])
+        self.assertEqual("1.000000,1.341641,0.750000,", statistics["d"])
+
+    def test_single_ticker(self):
+        # A single value has no spread, so its z-score is empty
+        df = pd.DataFrame({"2": ["-0.012"], "3": ["0.3"]}, index=["a"])
+
+        statistics = cross_sectional_statistics(df)
+
+        self.assertEqual("1.000000,,1.000000,", statistics["a"])
+
+    def test_column_without_values(self):
+        df = pd.DataFrame({"2": ["1", "2"], "3": [None, ""]}, index=["a", "b"])
+
+        statistics = cross_sectional_statistics(df)
+
+        self.assertEqual("0.500000,-1.000000,,", statistics["a"])
+        self.assertEqual("1.000000,1.000000,,", statistics["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
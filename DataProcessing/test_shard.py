@@ -0,0 +1,176 @@
+import json
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from shard import ShardSpec, SHARD_BY_MONTH, SHARD_BY_TICKER, SHARD_COMPLETE_FILE_NAME, get_merge_order, get_shard_directories, merge_pieces
+
+PROCESS_DATE = datetime(2024, 3, 1)
+
+# Same shape as process.FILE_PREFIXES, which can't be imported without the CLR
+FILE_PREFIXES = [
+    ('differences_10k', None, 'BLMCF_V2_DIFF_10K'),
+    ('metrics_10k', None, 'BLMCF_V2_10K'),
+    ('sentimentDays7', 7, 'BSI'),
+    ('sentimentDays30', 30, 'BSI'),
+    ('mlAlpha2Days', 2, 'BSR'),
+    ('mlAlpha21Days', 21, 'BSR')
+]
+REPORT_CATEGORIES = ['BLMCF_V2_DIFF_10K', 'BLMCF_V2_10K']
+
+
+class ShardSpecTests(unittest.TestCase):
+    def test_months_are_split_into_complete_disjoint_slices(self):
+        dates = pd.date_range('2009-12-01', '2012-02-29', freq='B').to_pydatetime()
+        for count in (1, 2, 3, 7):
+            owners = [[index for index in range(count) if ShardSpec(index, count).owns_date(date)] for date in dates]
+            self.assertTrue(all(len(owner) == 1 for owner in owners))
+            # Every day of a month belongs to the same shard
+            by_month = {}
+            for date, owner in zip(dates, owners):
+                by_month.setdefault((date.year, date.month), set()).add(owner[0])
+            self.assertTrue(all(len(shards) == 1 for shards in by_month.values()))
+
+    def test_securities_are_split_into_complete_disjoint_slices(self):
+        figis = pd.Series(['BBG000B9XRY4', 'BBG000BPH459', None, np.nan, 'BBG000BVPV84', 'BBG000B9XRY4'] + [f'BBG{i:09d}' for i in range(200)])
+        for count in (1, 2, 3, 7):
+            owned = pd.concat([ShardSpec(index, count, SHARD_BY_TICKER).owns_securities(figis).astype(int) for index in range(count)], axis=1)
+            self.assertTrue((owned.sum(axis=1) == 1).all())
+            # The same FIGI always lands in the same shard
+            self.assertEqual(owned.iloc[0].tolist(), owned.iloc[5].tolist())
+
+    def test_ticker_shards_own_every_date_and_month_shards_every_security(self):
+        figis = pd.Series(['BBG000B9XRY4', None])
+        self.assertTrue(all(ShardSpec(1, 3, SHARD_BY_TICKER).owns_date(PROCESS_DATE + timedelta(days=31 * i)) for i in range(3)))
+        self.assertTrue(ShardSpec(1, 3, SHARD_BY_MONTH).owns_securities(figis).all())
+
+    def test_invalid_shards(self):
+        with self.assertRaises(ValueError):
+            ShardSpec(2, 2)
+        with self.assertRaises(ValueError):
+            ShardSpec(0, 2, 'sector')
+
+
+class ShardDirectoriesTests(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def complete(self, count, by=SHARD_BY_MONTH):
+        for index in range(count):
+            shard = ShardSpec(index, count, by)
+            shard.clear(self.root)
+            shard.mark_complete(self.root, PROCESS_DATE)
+
+    def rewrite_marker(self, index, **values):
+        marker = self.root / f'shard_{index}' / SHARD_COMPLETE_FILE_NAME
+        spec = json.loads(marker.read_text(encoding='utf-8'))
+        spec.update(values)
+        marker.write_text(json.dumps(spec), encoding='utf-8')
+
+    def test_completed_shards(self):
+        self.complete(3)
+        self.assertEqual([self.root / f'shard_{i}' for i in range(3)], get_shard_directories(self.root, 3, PROCESS_DATE))
+
+    def test_clear_removes_stale_pieces(self):
+        self.complete(1)
+        (self.root / 'shard_0' / 'metrics_10k_20240301.pkl').touch()
+        ShardSpec(0, 1).clear(self.root)
+        self.assertEqual([], list((self.root / 'shard_0').iterdir()))
+
+    def test_rejects_missing_shard(self):
+        self.complete(3)
+        (self.root / 'shard_2' / SHARD_COMPLETE_FILE_NAME).unlink()
+        with self.assertRaisesRegex(ValueError, 'Shard 2 of 3 has not completed'):
+            get_shard_directories(self.root, 3, PROCESS_DATE)
+
+    def test_rejects_wrong_count(self):
+        self.complete(3)
+        self.rewrite_marker(1, count=2)
+        with self.assertRaisesRegex(ValueError, 'expected 1 of 3'):
+            get_shard_directories(self.root, 3, PROCESS_DATE)
+
+    def test_rejects_wrong_mode(self):
+        self.complete(2)
+        self.rewrite_marker(1, by=SHARD_BY_TICKER)
+        with self.assertRaisesRegex(ValueError, 'sharded by ticker'):
+            get_shard_directories(self.root, 2, PROCESS_DATE)
+
+    def test_rejects_wrong_process_date(self):
+        self.complete(2)
+        self.rewrite_marker(0, process_date='20240201')
+        with self.assertRaisesRegex(ValueError, 'processed for 20240201'):
+            get_shard_directories(self.root, 2, PROCESS_DATE)
+
+    def test_rejects_other_pandas_version(self):
+        self.complete(2)
+        self.rewrite_marker(1, pandas_version='0.25.3')
+        with self.assertRaisesRegex(ValueError, 'pandas 0.25.3'):
+            get_shard_directories(self.root, 2, PROCESS_DATE)
+
+
+class MergeTests(unittest.TestCase):
+    def unsharded_files(self, dates):
+        """ The (category, stem) pairs process.download returns for the dates, including the lookback of the report files """
+        files = []
+        for date in dates:
+            for file_prefix, _, category in FILE_PREFIXES:
+                file_date = date
+                if date == dates[0] and category in REPORT_CATEGORIES:
+                    # Friday before the first Monday of the month
+                    file_date = date - timedelta(days=3)
+                files.append((category, f'{file_prefix}_{file_date:%Y%m%d}'))
+        return files
+
+    def test_merge_order_matches_unsharded_order_of_every_category(self):
+        dates = pd.date_range('2024-04-01', '2024-04-30', freq='B').to_pydatetime()
+        expected = self.unsharded_files(dates)
+
+        # Pieces are found shard by shard, so any order of the stems has to give the same result
+        for seed in range(3):
+            stems = [stem for _, stem in expected]
+            random.Random(seed).shuffle(stems)
+            actual = get_merge_order(stems, FILE_PREFIXES)
+
+            self.assertEqual(sorted(expected), sorted(actual))
+            for category in {category for category, _ in expected}:
+                self.assertEqual([stem for c, stem in expected if c == category], [stem for c, stem in actual if c == category])
+
+    def test_lookback_report_file_is_first_of_its_category(self):
+        order = get_merge_order(['metrics_10k_20240304', 'metrics_10k_20240301', 'mlAlpha2Days_20240304', 'metrics_10k_20240305'], FILE_PREFIXES)
+        self.assertEqual([('BLMCF_V2_10K', 'metrics_10k_20240301'), ('BLMCF_V2_10K', 'metrics_10k_20240304'), ('BSR', 'mlAlpha2Days_20240304'), ('BLMCF_V2_10K', 'metrics_10k_20240305')], order)
+
+    def test_merged_pieces_are_identical_to_the_unsharded_rows(self):
+        raw = pd.DataFrame({
+            'ML_ALPHA': [0.1, np.nan, -0.012345, 3.0, 1e-7, 2.5],
+            'LAST_REPORT_CATEGORY': ['10-K', None, '10-Q', '10-K', '10-K', None],
+            'COMPOSITE_FIGI': ['BBG000B9XRY4', 'BBG000BPH459', None, np.nan, 'BBG000BVPV84', 'BBG000B9XRY4']
+        })
+        expected = raw.to_csv(float_format='%f')
+
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        for count in (1, 2, 3):
+            paths = []
+            for index in range(count):
+                shard = ShardSpec(index, count, SHARD_BY_TICKER)
+                piece = raw[shard.owns_securities(raw['COMPOSITE_FIGI'])].copy()
+                piece['raw_row'] = piece.index
+                paths.append(shard.clear(root) / 'mlAlpha2Days_20240301.pkl')
+                piece.to_pickle(paths[-1])
+
+            merged = merge_pieces([pd.read_pickle(path) for path in paths])
+
+            pd.testing.assert_frame_equal(raw, merged)
+            self.assertEqual(expected, merged.to_csv(float_format='%f'))
+
+
+if __name__ == '__main__':
+    unittest.main()
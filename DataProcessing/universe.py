@@ -3,6 +3,11 @@ import os
 from pathlib import Path
 from CLRImports import *
 
+from cross_section import cross_sectional_statistics
+
+RANKING_DAYS = ["2", "3", "5", "10", "21"]
+SENTIMENT_DAYS = ["7", "30"]
+
 class UniverseDataProcessing:
     def __init__(self, map_file_provider, process_all, process_date, path=None):
         self.map_file_provider = map_file_provider
@@ -19,12 +24,16 @@ class UniverseDataProcessing:
         data, universe_path = self.universe_creation("rankings")
 
         for date, ticker_data in data.items():
-            for i, (ticker, datum) in enumerate(sorted(ticker_data.items(), key=lambda x: x[0])):
-                date_time = datetime.strptime(date, "%Y%m%d")
-                sid = SecurityIdentifier.GenerateEquity(ticker, Market.USA, True, self.map_file_provider, date_time)
+            tickers = sorted(ticker_data.keys())
+            ranks = pd.DataFrame({days: [ticker_data[ticker].get(days) for ticker in tickers] for days in RANKING_DAYS}, index=tickers)
+            statistics = cross_sectional_statistics(ranks)
+            date_time = datetime.strptime(date, "%Y%m%d")
 
-                with open(f"{universe_path}/{date}.csv", "a", encoding="utf-8") as csv:
-                    csv.write(f"{sid},{ticker.upper()},{datum['2'] if '2' in datum else ''},{datum['3'] if '3' in datum else ''},{datum['5'] if '5' in datum else ''},{datum['10'] if '10' in datum else ''},{datum['21'] if '21' in datum else ''}\n")
+            with open(f"{universe_path}/{date}.csv", "a", encoding="utf-8") as csv:
+                for ticker in tickers:
+                    datum = ticker_data[ticker]
+                    sid = SecurityIdentifier.GenerateEquity(ticker, Market.USA, True, self.map_file_provider, date_time)
+                    csv.write(f"{sid},{ticker.upper()},{datum['2'] if '2' in datum else ''},{datum['3'] if '3' in datum else ''},{datum['5'] if '5' in datum else ''},{datum['10'] if '10' in datum else ''},{datum['21'] if '21' in datum else ''},{statistics[ticker]}\n")
 
     def report_universe_creation(self, data, universe_path):
         for date, ticker_data in data.items():
@@ -47,12 +56,17 @@ class UniverseDataProcessing:
         data, universe_path = self.universe_creation("sentiment")
 
         for date, ticker_data in data.items():
-            for i, (ticker, datum) in enumerate(sorted(ticker_data.items(), key=lambda x: x[0])):
-                date_time = datetime.strptime(date, "%Y%m%d")
-                sid = SecurityIdentifier.GenerateEquity(ticker, Market.USA, True, self.map_file_provider, date_time)
-
-                with open(f"{universe_path}/{date}.csv", "a", encoding="utf-8") as csv:
-                    csv.write(f"{sid},{ticker.upper()},{datum['7'] if '7' in datum else ',,,,'},{datum['30'] if '30' in datum else ',,,,'}\n")
+            tickers = sorted(ticker_data.keys())
+            # The sentiment score is the third of the five values of each lookback period
+            sentiments = pd.DataFrame({days: [ticker_data[ticker][days].split(",")[2] if days in ticker_data[ticker] else None for ticker in tickers] for days in SENTIMENT_DAYS}, index=tickers)
+            statistics = cross_sectional_statistics(sentiments)
+            date_time = datetime.strptime(date, "%Y%m%d")
+
+            with open(f"{universe_path}/{date}.csv", "a", encoding="utf-8") as csv:
+                for ticker in tickers:
+                    datum = ticker_data[ticker]
+                    sid = SecurityIdentifier.GenerateEquity(ticker, Market.USA, True, self.map_file_provider, date_time)
+                    csv.write(f"{sid},{ticker.upper()},{datum['7'] if '7' in datum else ',,,,'},{datum['30'] if '30' in datum else ',,,,'},{statistics[ticker]}\n")
 
     def universe_creation(self, dataset, report=False):
         base_path = self.path / dataset
@@ -57,6 +57,27 @@ namespace QuantConnect.DataLibrary.Tests
             Assert.AreEqual(-0.169, data.TotalBuzzVolume30Days);
             Assert.AreEqual(0.1196, data.Price);
             Assert.AreEqual("AAPL", data.Symbol.Value);
+            // Universe files without the cross-sectional statistics are still supported
+            Assert.IsNull(data.Sentiment7DaysPercentile);
+            Assert.IsNull(data.Sentiment30DaysZScore);
+        }
+
+        [Test]
+        public void ReaderCrossSectionalStatisticsTest()
+        {
+            var factory = new BrainSentimentIndicatorUniverse();
+            var line = "CNCE VO2R14MRA2XX,CNCE,,,,,,22,14,0.323100,-0.945800,-0.745700,,,0.812500,0.874211";
+
+            var config = CreateSubscriptionDataConfig();
+            var data = (BrainSentimentIndicatorUniverse)factory.Reader(config, line, new DateTime(2022, 04, 21), false);
+            Assert.IsNull(data.Sentiment7DaysPercentile);
+            Assert.IsNull(data.Sentiment7DaysZScore);
+            Assert.AreEqual(0.8125m, data.Sentiment30DaysPercentile);
+            Assert.AreEqual(0.874211m, data.Sentiment30DaysZScore);
+
+            var clone = (BrainSentimentIndicatorUniverse)data.Clone();
+            Assert.AreEqual(data.Sentiment30DaysPercentile, clone.Sentiment30DaysPercentile);
+            Assert.AreEqual(data.Sentiment30DaysZScore, clone.Sentiment30DaysZScore);
         }
 
         [Test]
@@ -53,6 +53,51 @@ namespace QuantConnect.DataLibrary.Tests
             Assert.AreEqual(20, data.Rank21Days);
             Assert.AreEqual(1, data.Price);
             Assert.AreEqual("AAPL", data.Symbol.Value);
+            // Universe files without the cross-sectional statistics are still supported
+            Assert.IsNull(data.Rank2DaysPercentile);
+            Assert.IsNull(data.Rank21DaysZScore);
+        }
+
+        [Test]
+        public void ReaderCrossSectionalStatisticsTest()
+        {
+            var factory = new BrainStockRankingUniverse();
+            var line = "AAPL R735QTJ8XC9X,AAPL,1,2,,,20,0.950000,1.644854,0.500000,0.000000,,,,,0.012500,-2.241403";
+
+            var config = CreateSubscriptionDataConfig();
+            var data = (BrainStockRankingUniverse)factory.Reader(config, line, new DateTime(2022, 04, 21), false);
+            Assert.AreEqual(0.95m, data.Rank2DaysPercentile);
+            Assert.AreEqual(1.644854m, data.Rank2DaysZScore);
+            Assert.AreEqual(0.5m, data.Rank3DaysPercentile);
+            Assert.AreEqual(0m, data.Rank3DaysZScore);
+            Assert.IsNull(data.Rank5DaysPercentile);
+            Assert.IsNull(data.Rank5DaysZScore);
+            Assert.IsNull(data.Rank10DaysPercentile);
+            Assert.IsNull(data.Rank10DaysZScore);
+            Assert.AreEqual(0.0125m, data.Rank21DaysPercentile);
+            Assert.AreEqual(-2.241403m, data.Rank21DaysZScore);
+
+            var clone = (BrainStockRankingUniverse)data.Clone();
+            Assert.AreEqual(data.Rank21DaysPercentile, clone.Rank21DaysPercentile);
+            Assert.AreEqual(data.Rank21DaysZScore, clone.Rank21DaysZScore);
+        }
+
+        [Test]
+        public void ReaderSingleTickerStatisticsTest()
+        {
+            // A date with a single ticker: the percentile is 1 and there is no z-score
+            var factory = new BrainStockRankingUniverse();
+            var line = "AAPL R735QTJ8XC9X,AAPL,-0.012,0.3,,,,1.000000,,1.000000,,,,,,,";
+
+            var config = CreateSubscriptionDataConfig();
+            var data = (BrainStockRankingUniverse)factory.Reader(config, line, new DateTime(2022, 04, 21), false);
+            Assert.AreEqual(-0.012m, data.Rank2Days);
+            Assert.AreEqual(1m, data.Rank2DaysPercentile);
+            Assert.IsNull(data.Rank2DaysZScore);
+            Assert.AreEqual(1m, data.Rank3DaysPercentile);
+            Assert.IsNull(data.Rank3DaysZScore);
+            Assert.IsNull(data.Rank21DaysPercentile);
+            Assert.IsNull(data.Rank21DaysZScore);
         }
 
         [Test]
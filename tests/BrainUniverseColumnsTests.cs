@@ -0,0 +1,90 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using QuantConnect.Data;
+using QuantConnect.DataSource;
+
+namespace QuantConnect.DataLibrary.Tests
+{
+    [TestFixture]
+    public class BrainUniverseColumnsTests
+    {
+        [Test]
+        public void SentimentIndicatorCsv()
+        {
+            var data = new List<BaseData>
+            {
+                new BrainSentimentIndicatorUniverse
+                {
+                    TotalArticleMentions7Days = 869,
+                    Sentiment7Days = 0.1196m,
+                    Sentiment30Days = -0.0976m,
+                    Sentiment7DaysPercentile = 0.95m,
+                    Symbol = new Symbol(SecurityIdentifier.Parse("AAPL R735QTJ8XC9X"), "AAPL")
+                },
+                new BrainSentimentIndicatorUniverse
+                {
+                    Symbol = new Symbol(SecurityIdentifier.Parse("A RPTMYV3VC57P"), "A")
+                }
+            };
+
+            var lines = BrainUniverseColumns.GetSentimentIndicatorCsv(data).Split('\n');
+
+            Assert.AreEqual(4, lines.Length);
+            Assert.AreEqual("Ticker,TotalArticleMentions7Days,SentimentalArticleMentions7Days,Sentiment7Days,TotalBuzzVolume7Days,SentimentalBuzzVolume7Days,"
+                + "TotalArticleMentions30Days,SentimentalArticleMentions30Days,Sentiment30Days,TotalBuzzVolume30Days,SentimentalBuzzVolume30Days,"
+                + "Sentiment7DaysPercentile,Sentiment7DaysZScore,Sentiment30DaysPercentile,Sentiment30DaysZScore", lines[0]);
+            Assert.AreEqual("AAPL,869,,0.1196,,,,,-0.0976,,,0.95,,,", lines[1]);
+            Assert.AreEqual("A,,,,,,,,,,,,,,", lines[2]);
+            Assert.AreEqual(string.Empty, lines[3]);
+            Assert.AreEqual(data.Select(d => d.Symbol).ToArray(), BrainUniverseColumns.GetSymbols(data));
+        }
+
+        [Test]
+        public void CompanyFilingLanguageMetricsCsv()
+        {
+            var data = new List<BaseData>
+            {
+                new BrainCompanyFilingLanguageMetricsUniverse10K
+                {
+                    ReportSentiment = BrainCompanyFilingLanguageMetrics.Parse(new List<string>{"10", "1.5", "-0.25", "", "", "", "", "", "", "", ""}),
+                    RiskFactorsStatementSentiment = BrainCompanyFilingLanguageMetrics.Parse(new List<string>{"", "", "", "", "", "", "", "", "", "", ""}, new List<string>{"0.5", "", ""}),
+
+                    Symbol = new Symbol(SecurityIdentifier.Parse("A RPTMYV3VC57P"), "A"),
+                    Time = new DateTime(2022, 04, 21)
+                }
+            };
+
+            var lines = BrainUniverseColumns.GetCompanyFilingLanguageMetricsCsv(data).Split('\n');
+            var header = lines[0].Split(',');
+            var row = lines[1].Split(',');
+
+            Assert.AreEqual(1 + 3 * 18, header.Length);
+            Assert.AreEqual(header.Length, row.Length);
+            Assert.AreEqual("A", row[0]);
+            Assert.AreEqual("10", row[Array.IndexOf(header, "ReportSentiment_SentenceCount")]);
+            Assert.AreEqual("-0.25", row[Array.IndexOf(header, "ReportSentiment_Sentiment")]);
+            Assert.AreEqual(string.Empty, row[Array.IndexOf(header, "ReportSentiment_Similarity_All")]);
+            Assert.AreEqual("0.5", row[Array.IndexOf(header, "RiskFactorsStatementSentiment_Similarity_All")]);
+            // A missing section is written as empty values
+            Assert.AreEqual(string.Empty, row[Array.IndexOf(header, "ManagementDiscussionAnalyasisOfFinancialConditionAndResultsOfOperations_Sentiment")]);
+        }
+    }
+}